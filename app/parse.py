@@ -1,10 +1,52 @@
-from dataclasses import dataclass
+import csv
+import os
+import re
+import warnings
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from operator import attrgetter
+from pathlib import Path
 from urllib.parse import urljoin
 
+from lxml import etree, html
+from selenium import webdriver
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    NoSuchElementException,
+    SessionNotCreatedException,
+    StaleElementReferenceException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions
+from selenium.webdriver.support.ui import WebDriverWait
+
 
 BASE_URL = "https://webscraper.io/"
 HOME_URL = urljoin(BASE_URL, "test-sites/e-commerce/more/")
 
+PAGE_PATHS = {
+    "home": "",
+    "computers": "computers",
+    "laptops": "computers/laptops",
+    "tablets": "computers/tablets",
+    "phones": "phones",
+    "touch": "phones/touch",
+}
+PAGES = {name: urljoin(HOME_URL, path) for name, path in PAGE_PATHS.items()}
+
+COOKIES_BUTTON_LOCATOR = (By.CLASS_NAME, "acceptCookies")
+MORE_BUTTON_LOCATOR = (By.CLASS_NAME, "ecomerce-items-scroll-more")
+PRODUCTS_LOCATOR = (By.CLASS_NAME, "thumbnail")
+LOAD_TIMEOUT = 10
+CSV_BUFFER_SIZE = 1 << 20
+
+PROFILES_DIR_ENV = "ECOMMERCE_SCRAPER_PROFILES_DIR"
+DISK_CACHE_SIZE = 256 * 1024 * 1024
+PROFILE_IN_USE_MESSAGE = "user data directory is already in use"
+
 
 @dataclass
 class Product:
@@ -15,8 +57,177 @@ class Product:
     num_of_reviews: int
 
 
+PRODUCT_FIELDS = [field.name for field in fields(Product)]
+product_row = attrgetter(*PRODUCT_FIELDS)
+
+
+def has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+XP_PRODUCTS = etree.XPath(f"//div[{has_class('thumbnail')}]")
+XP_TITLE = etree.XPath(f"string(.//a[{has_class('title')}]/@title)")
+XP_DESCRIPTION = etree.XPath(f"string(.//p[{has_class('description')}])")
+XP_PRICE = etree.XPath(f"string(.//*[{has_class('price')}])")
+XP_RATING = etree.XPath(
+    f"count(.//div[{has_class('ratings')}]"
+    f"//span[{has_class('ws-icon-star')}])"
+)
+XP_REVIEWS = etree.XPath(f"string(.//*[{has_class('review-count')}])")
+
+PRICE_PATTERN = re.compile(r"\d[\d,]*(?:\.\d+)?")
+
+
+def parse_price(price_text: str) -> float:
+    match = PRICE_PATTERN.search(price_text)
+    if match is None:
+        raise ValueError(f"Cannot parse price from {price_text!r}")
+    return float(match.group().replace(",", ""))
+
+
+def parse_single_product(product_element: html.HtmlElement) -> Product:
+    return Product(
+        title=XP_TITLE(product_element),
+        description=XP_DESCRIPTION(product_element).replace("\xa0", " "),
+        price=parse_price(XP_PRICE(product_element)),
+        rating=int(XP_RATING(product_element)),
+        num_of_reviews=int(XP_REVIEWS(product_element).split()[0]),
+    )
+
+
+def accept_cookies(driver: WebDriver) -> None:
+    try:
+        driver.find_element(*COOKIES_BUTTON_LOCATOR).click()
+    except NoSuchElementException:
+        return
+
+    WebDriverWait(driver, LOAD_TIMEOUT).until(
+        expected_conditions.invisibility_of_element_located(
+            COOKIES_BUTTON_LOCATOR
+        )
+    )
+
+
+def more_products_loaded(
+    products_count: int,
+) -> Callable[[WebDriver], bool]:
+    def condition(driver: WebDriver) -> bool:
+        return len(driver.find_elements(*PRODUCTS_LOCATOR)) > products_count
+
+    return condition
+
+
+def click_more_button(driver: WebDriver, more_button: WebElement) -> None:
+    try:
+        more_button.click()
+    except ElementClickInterceptedException:
+        accept_cookies(driver)
+        more_button.click()
+
+
+def load_all_products(driver: WebDriver) -> None:
+    wait = WebDriverWait(
+        driver,
+        LOAD_TIMEOUT,
+        ignored_exceptions=[StaleElementReferenceException],
+    )
+    while True:
+        try:
+            more_button = driver.find_element(*MORE_BUTTON_LOCATOR)
+            if not more_button.is_displayed():
+                return
+            products_count = len(driver.find_elements(*PRODUCTS_LOCATOR))
+            click_more_button(driver, more_button)
+        except NoSuchElementException:
+            return
+        except StaleElementReferenceException:
+            continue
+
+        wait.until(
+            expected_conditions.any_of(
+                more_products_loaded(products_count),
+                expected_conditions.invisibility_of_element_located(
+                    MORE_BUTTON_LOCATOR
+                ),
+            ),
+            message="More products did not load after clicking the button",
+        )
+
+
+def get_page_products(driver: WebDriver, url: str) -> list[Product]:
+    driver.get(url)
+    accept_cookies(driver)
+    load_all_products(driver)
+
+    tree = html.fromstring(driver.page_source)
+
+    return [
+        parse_single_product(product_element)
+        for product_element in XP_PRODUCTS(tree)
+    ]
+
+
+def write_products_to_csv(
+    filename: str, products: Iterable[Product]
+) -> None:
+    with open(
+        filename,
+        "w",
+        newline="",
+        encoding="utf-8",
+        buffering=CSV_BUFFER_SIZE,
+    ) as file:
+        writer = csv.writer(file)
+        writer.writerow(PRODUCT_FIELDS)
+        writer.writerows(map(product_row, products))
+
+
+def get_chrome_options(profile_dir: Path | None) -> webdriver.ChromeOptions:
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    options.add_argument("--disable-gpu")
+    if profile_dir is not None:
+        options.add_argument(f"--user-data-dir={profile_dir}")
+        options.add_argument(f"--disk-cache-size={DISK_CACHE_SIZE}")
+    options.add_experimental_option(
+        "prefs", {"profile.managed_default_content_settings.images": 2}
+    )
+    options.page_load_strategy = "eager"
+    return options
+
+
+def create_driver(profile: str) -> WebDriver:
+    profiles_dir = os.environ.get(PROFILES_DIR_ENV)
+    if not profiles_dir:
+        return webdriver.Chrome(options=get_chrome_options(None))
+
+    profile_dir = Path(profiles_dir) / profile
+    try:
+        return webdriver.Chrome(options=get_chrome_options(profile_dir))
+    except SessionNotCreatedException as error:
+        if PROFILE_IN_USE_MESSAGE not in str(error):
+            raise
+        warnings.warn(
+            f"Chrome profile {profile_dir} is in use by another process, "
+            "scraping with a temporary profile instead"
+        )
+        return webdriver.Chrome(options=get_chrome_options(None))
+
+
+def scrape_page(name: str, url: str) -> None:
+    with create_driver(name) as driver:
+        write_products_to_csv(f"{name}.csv", get_page_products(driver, url))
+
+
 def get_all_products() -> None:
-    pass
+    with ThreadPoolExecutor(max_workers=len(PAGES)) as executor:
+        futures = [
+            executor.submit(scrape_page, name, url)
+            for name, url in PAGES.items()
+        ]
+
+    for future in futures:
+        future.result()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,90 @@
+import pytest
+from selenium.common.exceptions import SessionNotCreatedException
+
+from app import parse
+
+
+class FakeChrome:
+    def __init__(self, options):
+        self.options = options
+
+
+@pytest.fixture
+def fake_chrome(monkeypatch):
+    monkeypatch.setattr(parse.webdriver, "Chrome", FakeChrome)
+
+
+def test_options_without_profile_use_temporary_profile():
+    arguments = parse.get_chrome_options(None).arguments
+
+    assert "--headless=new" in arguments
+    assert not any(
+        argument.startswith(("--user-data-dir=", "--disk-cache-size="))
+        for argument in arguments
+    )
+
+
+def test_options_with_profile_use_it_with_disk_cache(tmp_path):
+    arguments = parse.get_chrome_options(tmp_path / "laptops").arguments
+
+    assert f"--user-data-dir={tmp_path / 'laptops'}" in arguments
+    assert f"--disk-cache-size={parse.DISK_CACHE_SIZE}" in arguments
+
+
+def test_driver_without_profiles_dir_uses_temporary_profile(
+    monkeypatch, fake_chrome
+):
+    monkeypatch.delenv(parse.PROFILES_DIR_ENV, raising=False)
+
+    driver = parse.create_driver("laptops")
+
+    assert not any(
+        argument.startswith("--user-data-dir=")
+        for argument in driver.options.arguments
+    )
+
+
+def test_driver_with_profiles_dir_uses_page_profile(
+    monkeypatch, tmp_path, fake_chrome
+):
+    monkeypatch.setenv(parse.PROFILES_DIR_ENV, str(tmp_path))
+
+    driver = parse.create_driver("laptops")
+
+    assert f"--user-data-dir={tmp_path / 'laptops'}" in driver.options.arguments
+
+
+def test_locked_profile_falls_back_to_temporary_profile_with_warning(
+    monkeypatch, tmp_path
+):
+    def fake_chrome(options):
+        if any(
+            argument.startswith("--user-data-dir=")
+            for argument in options.arguments
+        ):
+            raise SessionNotCreatedException(
+                f"session not created: probably {parse.PROFILE_IN_USE_MESSAGE}"
+            )
+        return FakeChrome(options)
+
+    monkeypatch.setattr(parse.webdriver, "Chrome", fake_chrome)
+    monkeypatch.setenv(parse.PROFILES_DIR_ENV, str(tmp_path))
+
+    with pytest.warns(UserWarning, match="in use by another process"):
+        driver = parse.create_driver("laptops")
+
+    assert not any(
+        argument.startswith("--user-data-dir=")
+        for argument in driver.options.arguments
+    )
+
+
+def test_other_session_errors_are_not_hidden(monkeypatch, tmp_path):
+    def fake_chrome(options):
+        raise SessionNotCreatedException("Chrome version mismatch")
+
+    monkeypatch.setattr(parse.webdriver, "Chrome", fake_chrome)
+    monkeypatch.setenv(parse.PROFILES_DIR_ENV, str(tmp_path))
+
+    with pytest.raises(SessionNotCreatedException, match="mismatch"):
+        parse.create_driver("laptops")
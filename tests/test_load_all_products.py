@@ -0,0 +1,106 @@
+import pytest
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    NoSuchElementException,
+    TimeoutException,
+)
+
+from app import parse
+
+
+class FakeCookiesButton:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def click(self):
+        self.driver.cookies_banner = False
+
+    def is_displayed(self):
+        return self.driver.cookies_banner
+
+
+class FakeMoreButton:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def click(self):
+        if self.driver.cookies_banner:
+            raise ElementClickInterceptedException("cookies banner")
+        self.driver.clicks += 1
+        if self.driver.loads_products:
+            self.driver.products += 3
+
+    def is_displayed(self):
+        return self.driver.clicks < self.driver.batches
+
+
+class FakeDriver:
+    def __init__(self, batches, cookies_banner=False, loads_products=True):
+        self.batches = batches
+        self.cookies_banner = cookies_banner
+        self.loads_products = loads_products
+        self.clicks = 0
+        self.products = 3
+
+    def find_element(self, by, value):
+        if (by, value) == parse.COOKIES_BUTTON_LOCATOR:
+            if not self.cookies_banner:
+                raise NoSuchElementException(value)
+            return FakeCookiesButton(self)
+        if (by, value) == parse.MORE_BUTTON_LOCATOR:
+            if self.batches is None:
+                raise NoSuchElementException(value)
+            return FakeMoreButton(self)
+        raise NoSuchElementException(value)
+
+    def find_elements(self, by, value):
+        if (by, value) == parse.PRODUCTS_LOCATOR:
+            return [object()] * self.products
+        try:
+            return [self.find_element(by, value)]
+        except NoSuchElementException:
+            return []
+
+
+def test_page_without_more_button_returns_immediately():
+    driver = FakeDriver(batches=None)
+
+    parse.load_all_products(driver)
+
+    assert driver.clicks == 0
+
+
+@pytest.mark.parametrize("batches", [0, 1, 3])
+def test_each_batch_takes_one_click(batches):
+    driver = FakeDriver(batches=batches)
+
+    parse.load_all_products(driver)
+
+    assert driver.clicks == batches
+    assert driver.products == 3 + 3 * batches
+
+
+def test_click_blocked_by_cookies_banner_is_retried(monkeypatch):
+    accept_cookies_calls = []
+    accept_cookies = parse.accept_cookies
+
+    def accept_cookies_spy(driver):
+        accept_cookies_calls.append(driver)
+        accept_cookies(driver)
+
+    monkeypatch.setattr(parse, "accept_cookies", accept_cookies_spy)
+    driver = FakeDriver(batches=2, cookies_banner=True)
+
+    parse.load_all_products(driver)
+
+    assert accept_cookies_calls == [driver]
+    assert not driver.cookies_banner
+    assert driver.clicks == 2
+
+
+def test_products_not_loading_raises_timeout(monkeypatch):
+    monkeypatch.setattr(parse, "LOAD_TIMEOUT", 0)
+    driver = FakeDriver(batches=2, loads_products=False)
+
+    with pytest.raises(TimeoutException, match="did not load"):
+        parse.load_all_products(driver)
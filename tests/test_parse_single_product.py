@@ -0,0 +1,72 @@
+import pytest
+from lxml import html
+
+from app.parse import XP_PRODUCTS, Product, parse_single_product
+
+
+PRODUCT_HTML = """
+<div class="col-md-4 col-xl-4 col-lg-4">
+    <div class="card thumbnail">
+        <div class="card-body">
+            <div class="img-thumbnail">
+                <img class="img-fluid card-img-top image"
+                     src="/images/test-sites/e-commerce/items/cart2.png">
+            </div>
+            <div class="caption">
+                <h4 class="price-old">$1199.99</h4>
+                <h4 class="price float-end card-title pull-right">{price}</h4>
+                <h4>
+                    <a href="/test-sites/e-commerce/more/product/31"
+                       class="title"
+                       title="ThinkPad Yoga">ThinkPad Yo...</a>
+                </h4>
+                <p class="description card-text">12.5"&nbsp;Touch, Core i3</p>
+            </div>
+            <div class="ratings">
+                <p class="review-count float-end">10 reviews</p>
+                <p data-rating="4">
+                    <span class="ws-icon ws-icon-star"></span>
+                    <span class="ws-icon ws-icon-star"></span>
+                    <span class="ws-icon ws-icon-star"></span>
+                    <span class="ws-icon ws-icon-star"></span>
+                </p>
+            </div>
+        </div>
+    </div>
+</div>
+"""
+
+
+def parse_product_html(price: str = "$1033.99") -> list[Product]:
+    tree = html.fromstring(PRODUCT_HTML.format(price=price))
+    return [parse_single_product(element) for element in XP_PRODUCTS(tree)]
+
+
+def test_single_product_is_parsed():
+    assert parse_product_html() == [
+        Product(
+            title="ThinkPad Yoga",
+            description='12.5" Touch, Core i3',
+            price=1033.99,
+            rating=4,
+            num_of_reviews=10,
+        )
+    ]
+
+
+@pytest.mark.parametrize(
+    "price_text,price",
+    [
+        ("$1033.99", 1033.99),
+        (" $295.99 ", 295.99),
+        ("$1,139.54", 1139.54),
+        ("$12", 12.0),
+    ],
+)
+def test_price_is_parsed(price_text, price):
+    assert parse_product_html(price_text)[0].price == price
+
+
+def test_price_without_digits_is_rejected():
+    with pytest.raises(ValueError, match="'N/A'"):
+        parse_product_html("N/A")
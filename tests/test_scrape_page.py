@@ -0,0 +1,75 @@
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+
+from app import parse
+
+
+PRODUCT_HTML = """
+<div class="thumbnail">
+    <h4 class="price">{price}</h4>
+    <a class="title" title="{title}">{title}</a>
+    <p class="description">{title}</p>
+    <div class="ratings">
+        <p class="review-count">9 reviews</p>
+        <p><span class="ws-icon ws-icon-star"></span></p>
+    </div>
+</div>
+"""
+
+
+class FakeDriver:
+    def __init__(self, page_source):
+        self.page_source = page_source
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def get(self, url):
+        pass
+
+    def find_element(self, by, value):
+        raise NoSuchElementException(value)
+
+    def find_elements(self, by, value):
+        return []
+
+
+@pytest.fixture
+def serve_page(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+
+    def serve(*products):
+        page_source = "".join(
+            PRODUCT_HTML.format(title=title, price=price)
+            for title, price in products
+        )
+        monkeypatch.setattr(
+            parse, "create_driver", lambda profile: FakeDriver(page_source)
+        )
+
+    return serve
+
+
+def test_page_products_are_written(serve_page, tmp_path):
+    serve_page(("Nokia 123", "$24.99"))
+
+    parse.scrape_page("touch", "https://example.com/touch")
+
+    assert (tmp_path / "touch.csv").read_text(encoding="utf-8") == (
+        "title,description,price,rating,num_of_reviews\n"
+        "Nokia 123,Nokia 123,24.99,1,9\n"
+    )
+
+
+def test_parse_error_keeps_previous_csv(serve_page, tmp_path):
+    previous_csv = tmp_path / "touch.csv"
+    previous_csv.write_text("previous good file", encoding="utf-8")
+    serve_page(("Nokia 123", "$24.99"), ("LG Optimus", "N/A"))
+
+    with pytest.raises(ValueError):
+        parse.scrape_page("touch", "https://example.com/touch")
+
+    assert previous_csv.read_text(encoding="utf-8") == "previous good file"
@@ -0,0 +1,62 @@
+import csv
+
+from app.parse import PRODUCT_FIELDS, Product, write_products_to_csv
+
+
+PRODUCTS = [
+    Product(
+        title="ThinkPad Yoga",
+        description='12.5" Touch, Core i3-4010U, 4GB, 500GB + 16GB SSD Cache,',
+        price=1033.99,
+        rating=5,
+        num_of_reviews=10,
+    ),
+    Product(
+        title="Prestigio SmartBook 133S Dark Grey",
+        description="Prestigio SmartBook 133S Dark Grey",
+        price=299.0,
+        rating=5,
+        num_of_reviews=9,
+    ),
+]
+
+
+def test_products_are_written_in_reference_format(tmp_path):
+    filename = tmp_path / "laptops.csv"
+
+    write_products_to_csv(str(filename), PRODUCTS)
+
+    assert filename.read_bytes() == (
+        b"title,description,price,rating,num_of_reviews\r\n"
+        b'ThinkPad Yoga,"12.5"" Touch, Core i3-4010U, 4GB, '
+        b'500GB + 16GB SSD Cache,",1033.99,5,10\r\n'
+        b"Prestigio SmartBook 133S Dark Grey,"
+        b"Prestigio SmartBook 133S Dark Grey,299.0,5,9\r\n"
+    )
+
+
+def test_written_rows_line_up_with_header(tmp_path):
+    filename = tmp_path / "laptops.csv"
+
+    write_products_to_csv(str(filename), PRODUCTS)
+
+    with open(filename, newline="", encoding="utf-8") as file:
+        header, *rows = csv.reader(file)
+
+    assert header == PRODUCT_FIELDS
+    assert rows == [
+        [
+            "ThinkPad Yoga",
+            '12.5" Touch, Core i3-4010U, 4GB, 500GB + 16GB SSD Cache,',
+            "1033.99",
+            "5",
+            "10",
+        ],
+        [
+            "Prestigio SmartBook 133S Dark Grey",
+            "Prestigio SmartBook 133S Dark Grey",
+            "299.0",
+            "5",
+            "9",
+        ],
+    ]